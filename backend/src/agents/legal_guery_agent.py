@@ -4,11 +4,17 @@ Legal Query Agent for Dutch Law MCP.
 This module provides an AI agent that can answer legal questions
 based on Dutch legislation in MCP format.
 """
+import concurrent.futures
+import heapq
+import itertools
 import json
 import logging
+import operator
 import re
+from collections import OrderedDict
 from dataclasses import dataclass
-from typing import Dict, List, Optional, Any, Tuple
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Optional, Any, Tuple
 
 from ..api.client import MCPClient
 from ..models.law_model import MCPLaw
@@ -16,10 +22,10 @@ from ..models.law_model import MCPLaw
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class QueryResult:
     """Result of a legal query."""
-    
+
     answer: str
     confidence: float
     relevant_articles: List[Dict[str, Any]]
@@ -37,9 +43,142 @@ class ExpertiseLevel:
     EXPERT = "expert"
 
 
+# Patterns for specific laws, matched in one pass over the query.
+# The group name becomes the identifier in entities["specific_laws"];
+# growing this table does not add per-query scans.
+_LAW_PATTERNS = [
+    ("Grondwet", r"\bgrondwet\b"),
+    ("AWB", r"\b(?:awb|algemene wet bestuursrecht)\b"),
+    ("Sr", r"\bwetboek van strafrecht\b"),
+    ("Sv", r"\bwetboek van strafvordering\b"),
+]
+_LAW_RE = re.compile("|".join(
+    f"(?P<{law_id}>{pattern})" for law_id, pattern in _LAW_PATTERNS
+))
+
+# Keywords that indicate the type of question being asked.
+_QUESTION_TYPE_KEYWORDS = {
+    "definition": ["wat is", "wat zijn", "wat betekent", "definitie"],
+    "procedure": ["hoe", "procedure", "stappen"],
+    "condition": ["wanneer", "in welk geval"],
+    "obligation": ["mag", "moet", "verplicht", "verboden"],
+}
+
+# Priority order used when a query matches several question types.
+_QUESTION_TYPE_ORDER = ["definition", "procedure", "condition", "obligation"]
+
+# Explanation fragments per expertise level and question type
+_EXPERTISE_PREFIX = {
+    ExpertiseLevel.LAYPERSON: "In simple terms: ",
+    ExpertiseLevel.STUDENT: "For law students: ",
+    ExpertiseLevel.PROFESSIONAL: "Professional legal analysis: ",
+}
+_DEFAULT_EXPERTISE_PREFIX = "Expert legal analysis: "
+
+_QUESTION_TYPE_BODY = {
+    "definition": "This legal concept is defined in the cited articles. ",
+    "procedure": "The procedure is outlined in the following articles. ",
+    "condition": "The conditions are specified in the relevant legislation. ",
+    "obligation": "The legal obligations and requirements are as follows. ",
+}
+_DEFAULT_QUESTION_TYPE_BODY = "The relevant legal provisions are: "
+
+# Patterns for references to a Burgerlijk Wetboek book or a specific article
+_BW_RE = re.compile(r"burgerlijk(?:\s+wet)?(?:boek)?\s+(\d+)")
+_ARTICLE_RE = re.compile(r"artikel\s+(\d+[a-z]?(?::\d+)?)")
+
+# Pattern splitting a query into lowercase word tokens
+_TOKEN_RE = re.compile(r"[a-zà-ÿ]+")
+
+# Simple keyword mappings for demonstration purposes; shared across all
+# agent instances. In a real implementation, this would use vector
+# embeddings or a more sophisticated approach.
+_DOMAIN_KEYWORDS: Mapping[str, frozenset] = MappingProxyType({
+    "property": frozenset({"eigendom", "bezit", "zaak", "goed", "registergoed"}),
+    "contract": frozenset({"overeenkomst", "contract", "verbintenis", "wanprestatie"}),
+    "tort": frozenset({"onrechtmatige daad", "schade", "aansprakelijkheid"}),
+    "family": frozenset({"huwelijk", "echtscheiding", "alimentatie", "gezag", "ouderlijk"}),
+    "criminal": frozenset({"strafbaar", "misdrijf", "overtreding", "gevangenisstraf"}),
+    "administrative": frozenset({"besluit", "bestuursorgaan", "bezwaar", "beroep"}),
+    "tax": frozenset({"belasting", "fiscaal", "heffing", "aanslag"}),
+    "labor": frozenset({"arbeidsovereenkomst", "ontslag", "werknemer", "werkgever"}),
+    "business": frozenset({"vennootschap", "bestuurder", "onderneming", "fusie"})
+})
+
+# Representative search term used when searching laws for a domain
+_DOMAIN_SEARCH_TERMS: Mapping[str, str] = MappingProxyType({
+    "property": "eigendom",
+    "contract": "overeenkomst",
+    "tort": "onrechtmatige daad",
+    "family": "huwelijk",
+    "criminal": "strafrecht",
+    "administrative": "bestuursrecht",
+    "tax": "belasting",
+    "labor": "arbeidsovereenkomst",
+    "business": "vennootschap"
+})
+
+# Single-word keywords are matched as whole tokens with O(1) set lookups;
+# multi-word phrases go into the compiled scanner below.
+_DOMAIN_TOKENS: Mapping[str, frozenset] = MappingProxyType({
+    domain: frozenset(kw for kw in keywords if " " not in kw)
+    for domain, keywords in _DOMAIN_KEYWORDS.items()
+})
+
+# Flatten the token sets into a single keyword -> domain-bitmask table so
+# classification is one dict probe per query token instead of one set
+# intersection per domain. Bit i corresponds to _DOMAIN_ORDER[i].
+_DOMAIN_ORDER: Tuple[str, ...] = tuple(_DOMAIN_KEYWORDS)
+
+
+def _build_token_domain_bits() -> Dict[str, int]:
+    bits: Dict[str, int] = {}
+    for index, domain in enumerate(_DOMAIN_ORDER):
+        for keyword in _DOMAIN_TOKENS[domain]:
+            bits[keyword] = bits.get(keyword, 0) | (1 << index)
+    return bits
+
+
+_TOKEN_DOMAIN_BITS = _build_token_domain_bits()
+
+
+def _build_keyword_scanner() -> Tuple[Dict[str, Tuple[str, str]], "re.Pattern"]:
+    """Build a single compiled pattern matching every known keyword.
+
+    Returns:
+        A (tags, pattern) pair where tags maps each keyword to its
+        (category, label) classification and pattern matches any keyword.
+    """
+    tags: Dict[str, Tuple[str, str]] = {}
+
+    for domain, keywords in _DOMAIN_KEYWORDS.items():
+        for keyword in keywords:
+            if " " in keyword:
+                tags[keyword] = ("domain", domain)
+
+    for question_type, keywords in _QUESTION_TYPE_KEYWORDS.items():
+        for keyword in keywords:
+            tags[keyword] = ("question_type", question_type)
+
+    # Longest keywords first so multi-word phrases win over their prefixes
+    pattern = "|".join(
+        re.escape(keyword)
+        for keyword in sorted(tags, key=len, reverse=True)
+    )
+    return tags, re.compile(pattern)
+
+
+# Compile the scanner once at import; entity extraction is one linear
+# pass over the query (Aho-Corasick-style matching).
+_KEYWORD_TAGS, _KEYWORD_SCANNER = _build_keyword_scanner()
+
+# Maximum number of memoized entity extractions per agent
+_ENTITY_CACHE_MAX_SIZE = 1024
+
+
 class LegalQueryAgent:
     """Agent for answering legal questions about Dutch law."""
-    
+
     def __init__(
         self, 
         api_client: MCPClient,
@@ -65,21 +204,20 @@ class LegalQueryAgent:
         self.include_case_law = include_case_law
         self.include_explanations = include_explanations
         self.max_results = max_results
-        
-        # Simple keyword mappings for demonstration purposes
-        # In a real implementation, this would use vector embeddings or a more sophisticated approach
-        self.domain_keywords = {
-            "property": ["eigendom", "bezit", "zaak", "goed", "registergoed"],
-            "contract": ["overeenkomst", "contract", "verbintenis", "wanprestatie"],
-            "tort": ["onrechtmatige daad", "schade", "aansprakelijkheid"],
-            "family": ["huwelijk", "echtscheiding", "alimentatie", "gezag", "ouderlijk"],
-            "criminal": ["strafbaar", "misdrijf", "overtreding", "gevangenisstraf"],
-            "administrative": ["besluit", "bestuursorgaan", "bezwaar", "beroep"],
-            "tax": ["belasting", "fiscaal", "heffing", "aanslag"],
-            "labor": ["arbeidsovereenkomst", "ontslag", "werknemer", "werkgever"],
-            "business": ["vennootschap", "bestuurder", "onderneming", "fusie"]
-        }
-    
+
+        # Shared pool for fanning out API calls; the hot path is I/O-bound,
+        # so N searches/fetches take ~max(latency) instead of the sum.
+        self._pool = concurrent.futures.ThreadPoolExecutor(max_workers=8)
+
+
+        # Shared, immutable keyword tables; no per-instance reallocation
+        self.domain_keywords = _DOMAIN_KEYWORDS
+
+        # Entity extraction is a pure function of the query string, so
+        # repeat questions (retries, interactive re-runs) skip it entirely.
+        # Cached as immutable tuples; hits are rehydrated to fresh dicts.
+        self._entity_cache: "OrderedDict[str, Tuple]" = OrderedDict()
+
     def _extract_query_entities(self, query: str) -> Dict[str, Any]:
         """Extract entities from a query.
         
@@ -90,8 +228,24 @@ class LegalQueryAgent:
             Dictionary with extracted entities
         """
         # This would use NLP in a real implementation
-        # Here we use a very simple keyword-based approach
-        
+        # Here we use a simple keyword-based approach with a single scan
+
+        # Lowercase exactly once; everything below (cache key, tokens,
+        # scanners, regexes) works on the same string
+        q = query.lower()
+
+        cached = self._entity_cache.get(q)
+        if cached is not None:
+            self._entity_cache.move_to_end(q)
+            domains, law_types, specific_laws, specific_articles, question_type = cached
+            return {
+                "domains": list(domains),
+                "law_types": list(law_types),
+                "specific_laws": list(specific_laws),
+                "specific_articles": list(specific_articles),
+                "question_type": question_type
+            }
+
         entities = {
             "domains": [],
             "law_types": [],
@@ -99,38 +253,65 @@ class LegalQueryAgent:
             "specific_articles": [],
             "question_type": None
         }
-        
-        # Detect legal domains
-        for domain, keywords in self.domain_keywords.items():
-            if any(keyword in query.lower() for keyword in keywords):
-                entities["domains"].append(domain)
-        
+
+        tokens = set(_TOKEN_RE.findall(q))
+
+        # Whole-token domain keywords: accumulate a domain bitmask with one
+        # dict probe per token, then decode it
+        domain_mask = 0
+        for token in tokens:
+            domain_mask |= _TOKEN_DOMAIN_BITS.get(token, 0)
+        matched_domains = {
+            domain for index, domain in enumerate(_DOMAIN_ORDER)
+            if domain_mask >> index & 1
+        }
+
+        # Multi-word phrases and question-type keywords in one pass
+        matched_question_types = set()
+        for match in _KEYWORD_SCANNER.finditer(q):
+            category, label = _KEYWORD_TAGS[match.group()]
+            if category == "domain":
+                matched_domains.add(label)
+            else:
+                matched_question_types.add(label)
+
+        # Match all known law names and abbreviations in a single pass
+        matched_laws = {match.lastgroup for match in _LAW_RE.finditer(q)}
+
+        entities["domains"] = [
+            domain for domain in self.domain_keywords if domain in matched_domains
+        ]
+
         # Detect specific laws (simple regex patterns)
-        bw_match = re.search(r"burgerlijk(?:\s+wet)?(?:boek)?\s+(\d+)", query.lower())
+        bw_match = _BW_RE.search(q)
         if bw_match:
             entities["specific_laws"].append(f"BW{bw_match.group(1)}")
-        
-        if "grondwet" in query.lower():
-            entities["specific_laws"].append("Grondwet")
-        
-        if "algemene wet bestuursrecht" in query.lower() or "awb" in query.lower():
-            entities["specific_laws"].append("AWB")
-        
+
+        for law_id, _ in _LAW_PATTERNS:
+            if law_id in matched_laws:
+                entities["specific_laws"].append(law_id)
+
         # Detect specific articles
-        article_match = re.search(r"artikel\s+(\d+[a-z]?(?::\d+)?)", query.lower())
+        article_match = _ARTICLE_RE.search(q)
         if article_match:
             entities["specific_articles"].append(article_match.group(1))
-        
-        # Determine question type
-        if any(word in query.lower() for word in ["wat is", "wat zijn", "wat betekent", "definitie"]):
-            entities["question_type"] = "definition"
-        elif any(word in query.lower() for word in ["hoe", "procedure", "stappen"]):
-            entities["question_type"] = "procedure"
-        elif any(word in query.lower() for word in ["wanneer", "in welk geval"]):
-            entities["question_type"] = "condition"
-        elif any(word in query.lower() for word in ["mag", "moet", "verplicht", "verboden"]):
-            entities["question_type"] = "obligation"
-        
+
+        # Determine question type (most specific match wins)
+        for question_type in _QUESTION_TYPE_ORDER:
+            if question_type in matched_question_types:
+                entities["question_type"] = question_type
+                break
+
+        if len(self._entity_cache) >= _ENTITY_CACHE_MAX_SIZE:
+            self._entity_cache.popitem(last=False)
+        self._entity_cache[q] = (
+            tuple(entities["domains"]),
+            tuple(entities["law_types"]),
+            tuple(entities["specific_laws"]),
+            tuple(entities["specific_articles"]),
+            entities["question_type"]
+        )
+
         return entities
     
     def _search_relevant_laws(self, query: str, entities: Dict[str, Any]) -> List[Dict[str, Any]]:
@@ -145,7 +326,7 @@ class LegalQueryAgent:
         """
         # If we have specific laws mentioned, search for those
         if entities["specific_laws"]:
-            results = []
+            search_terms = []
             for law_id in entities["specific_laws"]:
                 # Map common abbreviations to potential search terms
                 search_term = law_id
@@ -153,40 +334,32 @@ class LegalQueryAgent:
                     search_term = f"Burgerlijk Wetboek {law_id[2:]}"
                 elif law_id == "AWB":
                     search_term = "Algemene wet bestuursrecht"
-                
-                # Search for the specific law
-                laws = self.client.search_laws(search_term)
-                results.extend(laws)
-            
-            return results[:self.max_results]
+                search_terms.append(search_term)
+
+            # Search for all specific laws concurrently, deduplicated by
+            # law ID (dict insertion preserves first-seen order)
+            unique = {}
+            for law in itertools.chain.from_iterable(
+                self._pool.map(self.client.search_laws, search_terms)
+            ):
+                unique.setdefault(law["id"], law)
+            return list(unique.values())[:self.max_results]
         
         # If we have domains, search based on those
         if entities["domains"]:
-            domain_terms = []
-            for domain in entities["domains"]:
-                if domain == "property":
-                    domain_terms.append("eigendom")
-                elif domain == "contract":
-                    domain_terms.append("overeenkomst")
-                elif domain == "tort":
-                    domain_terms.append("onrechtmatige daad")
-                # Add mappings for other domains
-                
-            # Search for each domain term and combine results
-            results = []
-            for term in domain_terms:
-                laws = self.client.search_laws(term)
-                results.extend(laws)
-            
-            # Remove duplicates (based on law ID)
-            unique_results = []
-            seen_ids = set()
-            for law in results:
-                if law["id"] not in seen_ids:
-                    unique_results.append(law)
-                    seen_ids.add(law["id"])
-            
-            return unique_results[:self.max_results]
+            domain_terms = [
+                _DOMAIN_SEARCH_TERMS[domain]
+                for domain in entities["domains"]
+                if domain in _DOMAIN_SEARCH_TERMS
+            ]
+
+            # Search for all domain terms concurrently, deduplicated by law ID
+            unique = {}
+            for law in itertools.chain.from_iterable(
+                self._pool.map(self.client.search_laws, domain_terms)
+            ):
+                unique.setdefault(law["id"], law)
+            return list(unique.values())[:self.max_results]
         
         # If we have neither specific laws nor domains, search with the full query
         return self.client.search_laws(query)[:self.max_results]
@@ -204,16 +377,31 @@ class LegalQueryAgent:
         """
         relevant_articles = []
         
-        # If we have specific articles, find those
+        # If we have specific articles, fetch them all in one batch request
         if entities["specific_articles"] and laws:
-            for law in laws:
-                law_id = law["id"]
-                for article_id in entities["specific_articles"]:
-                    try:
-                        article = self.client.get_article(law_id, article_id)
-                        relevant_articles.append(article)
-                    except Exception as e:
-                        logger.warning(f"Failed to get article {article_id} from law {law_id}: {e}")
+            def fetch_article(pair):
+                law_id, article_id = pair
+                try:
+                    return self.client.get_article(law_id, article_id)
+                except Exception as e:
+                    logger.warning(f"Failed to get article {article_id} from law {law_id}: {e}")
+                    return None
+
+            pairs = [
+                (law["id"], article_id)
+                for law in laws
+                for article_id in entities["specific_articles"]
+            ]
+            try:
+                relevant_articles.extend(self.client.get_articles_batch(pairs))
+            except Exception as e:
+                # Server without the batch endpoint: fall back to
+                # concurrent per-article fetches
+                logger.warning(f"Batch article fetch failed, falling back: {e}")
+                relevant_articles.extend(
+                    article for article in self._pool.map(fetch_article, pairs)
+                    if article is not None
+                )
         
         # Otherwise, search for relevant articles based on the query
         else:
@@ -230,16 +418,21 @@ class LegalQueryAgent:
                         {"id": "2", "title": "Article 2", "content": "This is article 2", "relevance": 0.75},
                     ]
                     
-                    relevant_articles.extend([
-                        {**article, "law_id": law_id, "law_title": law["title"]}
-                        for article in article_search_results
-                    ])
+                    # Annotate in place instead of copying each dict; the
+                    # search results are built fresh for this call
+                    for article in article_search_results:
+                        article["law_id"] = law_id
+                        article["law_title"] = law["title"]
+                        relevant_articles.append(article)
                 except Exception as e:
                     logger.warning(f"Failed to search articles in law {law_id}: {e}")
         
-        # Sort by relevance and limit results
-        relevant_articles.sort(key=lambda x: x.get("relevance", 0), reverse=True)
-        return relevant_articles[:self.max_results]
+        # Top-k by relevance: O(N log k) instead of a full sort
+        for article in relevant_articles:
+            article.setdefault("relevance", 0)
+        return heapq.nlargest(
+            self.max_results, relevant_articles, key=operator.itemgetter("relevance")
+        )
     
     def _find_relevant_case_law(self, articles: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """Find case law relevant to the given articles.
@@ -253,38 +446,48 @@ class LegalQueryAgent:
         if not self.include_case_law:
             return []
         
-        relevant_cases = []
-        
+        def fetch_case_law(pair):
+            law_id, article_id = pair
+            try:
+                # In a real implementation, this would get cases specifically for an article
+                # For demonstration, we get cases for the whole law; the
+                # generator stops paginating once we have enough
+                cases = list(itertools.islice(
+                    self.client.iter_case_law(law_id), self.max_results
+                ))
+            except Exception as e:
+                logger.warning(f"Failed to get case law for article {article_id} in law {law_id}: {e}")
+                return []
+
+            # Add source information
+            for case in cases:
+                case["source_article"] = article_id
+                case["source_law"] = law_id
+            return cases
+
+        # The same law backs many articles; fetch each law's case law once,
+        # attributed to the first article that referenced it
+        law_articles: Dict[str, str] = {}
         for article in articles:
             law_id = article.get("law_id")
             article_id = article.get("id")
-            
             if law_id and article_id:
-                try:
-                    # In a real implementation, this would get cases specifically for an article
-                    # For demonstration, we get cases for the whole law
-                    cases = self.client.get_case_law(law_id)
-                    
-                    # Add source information
-                    for case in cases:
-                        case["source_article"] = article_id
-                        case["source_law"] = law_id
-                    
-                    relevant_cases.extend(cases)
-                except Exception as e:
-                    logger.warning(f"Failed to get case law for article {article_id} in law {law_id}: {e}")
-        
-        # Remove duplicates and limit results
-        unique_cases = []
+                law_articles.setdefault(law_id, article_id)
+
+        # Deduplicate while accumulating and stop once we have enough
+        unique_cases: List[Dict[str, Any]] = []
         seen_case_ids = set()
-        
-        for case in relevant_cases:
-            case_id = case.get("id")
-            if case_id and case_id not in seen_case_ids:
-                unique_cases.append(case)
-                seen_case_ids.add(case_id)
-        
-        return unique_cases[:self.max_results]
+
+        for cases in self._pool.map(fetch_case_law, law_articles.items()):
+            for case in cases:
+                case_id = case.get("id")
+                if case_id and case_id not in seen_case_ids:
+                    unique_cases.append(case)
+                    seen_case_ids.add(case_id)
+                    if len(unique_cases) >= self.max_results:
+                        return unique_cases
+
+        return unique_cases
     
     def _generate_explanation(self, query: str, entities: Dict[str, Any], articles: List[Dict[str, Any]], expertise_level: str) -> str:
         """Generate an explanation for the query result.
@@ -300,43 +503,28 @@ class LegalQueryAgent:
         """
         if not self.include_explanations:
             return None
-        
+
         # This would use an LLM in a real implementation
-        # For demonstration, we generate a simple explanation
-        
-        if expertise_level == ExpertiseLevel.LAYPERSON:
-            explanation = "In simple terms: "
-        elif expertise_level == ExpertiseLevel.STUDENT:
-            explanation = "For law students: "
-        elif expertise_level == ExpertiseLevel.PROFESSIONAL:
-            explanation = "Professional legal analysis: "
-        else:
-            explanation = "Expert legal analysis: "
-        
-        # Add a basic explanation based on question type
-        question_type = entities.get("question_type")
-        
-        if question_type == "definition":
-            explanation += "This legal concept is defined in the cited articles. "
-        elif question_type == "procedure":
-            explanation += "The procedure is outlined in the following articles. "
-        elif question_type == "condition":
-            explanation += "The conditions are specified in the relevant legislation. "
-        elif question_type == "obligation":
-            explanation += "The legal obligations and requirements are as follows. "
-        else:
-            explanation += "The relevant legal provisions are: "
-        
+        # For demonstration, we assemble a simple explanation from
+        # precomputed fragments
+
+        parts = [
+            _EXPERTISE_PREFIX.get(expertise_level, _DEFAULT_EXPERTISE_PREFIX),
+            _QUESTION_TYPE_BODY.get(
+                entities.get("question_type"), _DEFAULT_QUESTION_TYPE_BODY
+            ),
+        ]
+
         # Add information about the articles
         if articles:
-            explanation += f"There are {len(articles)} relevant articles that address this question. "
-            
+            parts.append(f"There are {len(articles)} relevant articles that address this question. ")
+
             # For simple explanations, summarize the first article
-            if expertise_level == ExpertiseLevel.LAYPERSON and articles:
+            if expertise_level == ExpertiseLevel.LAYPERSON:
                 article = articles[0]
-                explanation += f"Most importantly, {article.get('title', 'the law')} states that [simplified explanation would go here]. "
-        
-        return explanation
+                parts.append(f"Most importantly, {article.get('title', 'the law')} states that [simplified explanation would go here]. ")
+
+        return "".join(parts)
     
     def query(self, question: str, expertise_level: Optional[str] = None) -> QueryResult:
         """Answer a legal question.
@@ -368,32 +556,32 @@ class LegalQueryAgent:
         logger.info(f"Found {len(relevant_case_law)} relevant cases")
         
         # Generate sources list
-        sources = []
-        for article in relevant_articles:
-            law_title = article.get("law_title", "Unknown Law")
-            article_id = article.get("id", "Unknown Article")
-            sources.append(f"{law_title}, Article {article_id}")
-        
-        for case in relevant_case_law:
-            case_name = case.get("name", "Unknown Case")
-            case_reference = case.get("reference", "")
-            if case_reference:
-                sources.append(f"{case_name} ({case_reference})")
-            else:
-                sources.append(case_name)
-        
+        sources = [
+            f"{article.get('law_title', 'Unknown Law')}, Article {article.get('id', 'Unknown Article')}"
+            for article in relevant_articles
+        ]
+        sources.extend(
+            f"{case.get('name', 'Unknown Case')} ({case['reference']})"
+            if case.get("reference") else case.get("name", "Unknown Case")
+            for case in relevant_case_law
+        )
+
         # Generate explanation
         explanation = self._generate_explanation(question, entities, relevant_articles, expertise)
-        
+
         # In a real implementation, this would generate an answer using an LLM
-        # For demonstration, we create a simple answer
-        answer = f"Based on the Dutch legislation, "
-        
+        # For demonstration, we assemble a simple answer without repeated
+        # string concatenation
+        answer_parts = ["Based on the Dutch legislation, "]
+
         if relevant_articles:
             article = relevant_articles[0]
-            answer += f"according to {article.get('law_title', 'the law')}, Article {article.get('id', '')}, "
-        
-        answer += "the answer to your question would involve [detailed answer would be generated here]."
+            answer_parts.append(
+                f"according to {article.get('law_title', 'the law')}, Article {article.get('id', '')}, "
+            )
+
+        answer_parts.append("the answer to your question would involve [detailed answer would be generated here].")
+        answer = "".join(answer_parts)
         
         # Return the result
         return QueryResult(
@@ -10,11 +10,38 @@ from datetime import datetime
 from typing import Dict, List, Optional, Any, Union
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 from ..models.law_model import MCPLaw
 
 logger = logging.getLogger(__name__)
 
+if orjson is not None:
+    # orjson decodes/encodes the nested law and article payloads several
+    # times faster than the stdlib json module
+    _json_loads = orjson.loads
+    _json_dumps = orjson.dumps
+    _JSONDecodeError = orjson.JSONDecodeError
+else:
+    _json_loads = json.loads
+
+    def _json_dumps(obj):
+        return json.dumps(obj).encode("utf-8")
+
+    _JSONDecodeError = json.JSONDecodeError
+
+# Maximum number of responses kept per client-side cache
+_CACHE_MAX_SIZE = 1024
+
+# Timeout for API requests, in seconds
+_REQUEST_TIMEOUT = 10.0
+
 
 class MCPClient:
     """Client for the MCP API."""
@@ -29,7 +56,29 @@ class MCPClient:
         self.base_url = base_url.rstrip('/')
         self.api_key = api_key
         self.session = requests.Session()
-        
+
+        # Keep-alive connection pool sized for the agent's thread-pool
+        # fan-out, with retries for transient upstream errors
+        adapter = HTTPAdapter(
+            pool_connections=32,
+            pool_maxsize=32,
+            max_retries=Retry(
+                total=2,
+                backoff_factor=0.3,
+                status_forcelist=[429, 502, 503, 504]
+            )
+        )
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+        # Read-only endpoints are cached in-process so repeated lookups
+        # (e.g. the same search term for overlapping domains, or the same
+        # article referenced by several laws) skip the network round trip.
+        self._law_cache: Dict[str, Dict[str, Any]] = {}
+        self._search_cache: Dict[Any, List[Dict[str, Any]]] = {}
+        self._article_cache: Dict[Any, Dict[str, Any]] = {}
+        self._case_law_cache: Dict[Any, List[Dict[str, Any]]] = {}
+
         if api_key:
             self.session.headers.update({
                 "Authorization": f"Bearer {api_key}",
@@ -42,6 +91,14 @@ class MCPClient:
                 "Accept": "application/json"
             })
     
+    @staticmethod
+    def _cache_put(cache: Dict[Any, Any], key: Any, value: Any) -> Any:
+        """Store a value in a client-side cache, evicting the oldest entry."""
+        if len(cache) >= _CACHE_MAX_SIZE:
+            cache.pop(next(iter(cache)))
+        cache[key] = value
+        return value
+
     def _handle_response(self, response: requests.Response) -> Dict[str, Any]:
         """Handle API response.
         
@@ -57,22 +114,22 @@ class MCPClient:
         """
         try:
             response.raise_for_status()
-            return response.json()
-        except json.JSONDecodeError:
+            return _json_loads(response.content)
+        except _JSONDecodeError:
             logger.error(f"Failed to decode JSON response: {response.text}")
             raise ValueError("Invalid JSON response from API")
         except requests.HTTPError as e:
             logger.error(f"HTTP error: {e}")
-            
+
             # Try to extract error details from response
             error_msg = "Unknown error"
             try:
-                error_data = response.json()
+                error_data = _json_loads(response.content)
                 if "error" in error_data:
                     error_msg = error_data["error"]
                 elif "message" in error_data:
                     error_msg = error_data["message"]
-            except (json.JSONDecodeError, KeyError):
+            except (_JSONDecodeError, KeyError):
                 error_msg = response.text
             
             raise requests.HTTPError(f"{response.status_code}: {error_msg}", response=response)
@@ -90,11 +147,31 @@ class MCPClient:
         url = f"{self.base_url}/laws"
         params = {"limit": limit, "offset": offset}
         
-        response = self.session.get(url, params=params)
+        response = self.session.get(url, params=params, timeout=_REQUEST_TIMEOUT)
         data = self._handle_response(response)
         
         return data.get("laws", [])
     
+    def iter_laws(self, page_size: int = 100):
+        """Iterate over all laws, paginating transparently.
+
+        Yields laws one at a time so callers can stop early (e.g. via
+        itertools.islice) without materializing every page.
+
+        Args:
+            page_size: Number of laws fetched per request
+
+        Yields:
+            Law data dictionaries
+        """
+        offset = 0
+        while True:
+            batch = self.get_laws(limit=page_size, offset=offset)
+            if not batch:
+                return
+            yield from batch
+            offset += len(batch)
+
     def get_law(self, law_id: str) -> Dict[str, Any]:
         """Get a law by ID.
         
@@ -107,10 +184,13 @@ class MCPClient:
         Raises:
             requests.HTTPError: If the law cannot be found
         """
+        if law_id in self._law_cache:
+            return self._law_cache[law_id]
+
         url = f"{self.base_url}/laws/{law_id}"
-        
-        response = self.session.get(url)
-        return self._handle_response(response)
+
+        response = self.session.get(url, timeout=_REQUEST_TIMEOUT)
+        return self._cache_put(self._law_cache, law_id, self._handle_response(response))
     
     def search_laws(self, query: str, filters: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
         """Search for laws.
@@ -122,16 +202,20 @@ class MCPClient:
         Returns:
             List of matching laws
         """
+        cache_key = (query, json.dumps(filters, sort_keys=True) if filters else None)
+        if cache_key in self._search_cache:
+            return self._search_cache[cache_key]
+
         url = f"{self.base_url}/search"
-        
+
         payload = {"query": query}
         if filters:
             payload["filters"] = filters
-        
-        response = self.session.post(url, json=payload)
+
+        response = self.session.post(url, data=_json_dumps(payload), timeout=_REQUEST_TIMEOUT)
         data = self._handle_response(response)
-        
-        return data.get("results", [])
+
+        return self._cache_put(self._search_cache, cache_key, data.get("results", []))
     
     def get_article(self, law_id: str, article_id: str) -> Dict[str, Any]:
         """Get a specific article from a law.
@@ -146,11 +230,41 @@ class MCPClient:
         Raises:
             requests.HTTPError: If the article cannot be found
         """
+        cache_key = (law_id, article_id)
+        if cache_key in self._article_cache:
+            return self._article_cache[cache_key]
+
         url = f"{self.base_url}/laws/{law_id}/articles/{article_id}"
-        
-        response = self.session.get(url)
-        return self._handle_response(response)
+
+        response = self.session.get(url, timeout=_REQUEST_TIMEOUT)
+        return self._cache_put(self._article_cache, cache_key, self._handle_response(response))
     
+    def get_articles_batch(self, pairs: List[tuple]) -> List[Dict[str, Any]]:
+        """Get several articles in a single request.
+
+        Args:
+            pairs: List of (law_id, article_id) tuples
+
+        Returns:
+            List of article data
+
+        Raises:
+            requests.HTTPError: If the batch request fails (e.g. the server
+                does not provide the batch endpoint)
+        """
+        url = f"{self.base_url}/articles/batch"
+        payload = {
+            "pairs": [
+                {"law_id": law_id, "article_id": article_id}
+                for law_id, article_id in pairs
+            ]
+        }
+
+        response = self.session.post(url, data=_json_dumps(payload), timeout=_REQUEST_TIMEOUT)
+        data = self._handle_response(response)
+
+        return data.get("articles", [])
+
     def get_case_law(self, law_id: str, limit: int = 10, offset: int = 0) -> List[Dict[str, Any]]:
         """Get case law related to a specific law.
         
@@ -162,14 +276,36 @@ class MCPClient:
         Returns:
             List of related case law
         """
+        cache_key = (law_id, limit, offset)
+        if cache_key in self._case_law_cache:
+            return self._case_law_cache[cache_key]
+
         url = f"{self.base_url}/laws/{law_id}/case-law"
         params = {"limit": limit, "offset": offset}
-        
-        response = self.session.get(url, params=params)
+
+        response = self.session.get(url, params=params, timeout=_REQUEST_TIMEOUT)
         data = self._handle_response(response)
-        
-        return data.get("cases", [])
+
+        return self._cache_put(self._case_law_cache, cache_key, data.get("cases", []))
     
+    def iter_case_law(self, law_id: str, page_size: int = 100):
+        """Iterate over all case law for a law, paginating transparently.
+
+        Args:
+            law_id: The ID of the law
+            page_size: Number of cases fetched per request
+
+        Yields:
+            Case law dictionaries
+        """
+        offset = 0
+        while True:
+            batch = self.get_case_law(law_id, limit=page_size, offset=offset)
+            if not batch:
+                return
+            yield from batch
+            offset += len(batch)
+
     def submit_law(self, law_data: Union[Dict[str, Any], MCPLaw]) -> Dict[str, Any]:
         """Submit a new law to the API.
         
@@ -205,7 +341,7 @@ class MCPClient:
         else:
             payload = law_data
         
-        response = self.session.post(url, json=payload)
+        response = self.session.post(url, data=_json_dumps(payload), timeout=_REQUEST_TIMEOUT)
         return self._handle_response(response)
     
     def update_law(self, law_id: str, law_data: Dict[str, Any]) -> Dict[str, Any]:
@@ -222,8 +358,11 @@ class MCPClient:
             requests.HTTPError: If the update fails
         """
         url = f"{self.base_url}/laws/{law_id}"
-        
-        response = self.session.put(url, json=law_data)
+
+        # The cached copy is stale once the law is updated
+        self._law_cache.pop(law_id, None)
+
+        response = self.session.put(url, data=_json_dumps(law_data), timeout=_REQUEST_TIMEOUT)
         return self._handle_response(response)
     
     def get_related_laws(self, law_id: str) -> List[Dict[str, Any]]:
@@ -237,7 +376,7 @@ class MCPClient:
         """
         url = f"{self.base_url}/laws/{law_id}/related"
         
-        response = self.session.get(url)
+        response = self.session.get(url, timeout=_REQUEST_TIMEOUT)
         data = self._handle_response(response)
         
         return data.get("related_laws", [])
@@ -253,7 +392,7 @@ class MCPClient:
         """
         url = f"{self.base_url}/laws/{law_id}/timeline"
         
-        response = self.session.get(url)
+        response = self.session.get(url, timeout=_REQUEST_TIMEOUT)
         data = self._handle_response(response)
         
         return data.get("timeline", [])
@@ -269,7 +408,7 @@ class MCPClient:
         """
         url = f"{self.base_url}/laws/{law_id}/statistics"
         
-        response = self.session.get(url)
+        response = self.session.get(url, timeout=_REQUEST_TIMEOUT)
         return self._handle_response(response)
 
 
@@ -3,9 +3,17 @@
 Command-line interface for the Dutch Legal Assistant.
 """
 import argparse
+import functools
 import sys
 from src.test_legal_assistant import LegalAssistant
 
+
+@functools.lru_cache(maxsize=1)
+def get_assistant():
+    """Build the LegalAssistant once per process."""
+    return LegalAssistant()
+
+
 def main():
     parser = argparse.ArgumentParser(description='Dutch Legal Assistant - Get legal advice for your situation')
     parser.add_argument('situation', nargs='+', help='Describe your legal situation')
@@ -18,7 +26,7 @@ def main():
     
     try:
         # Initialize the legal assistant
-        assistant = LegalAssistant()
+        assistant = get_assistant()
         
         # Analyze the situation
         print("\nAnalyzing your situation...")
@@ -26,11 +34,8 @@ def main():
         print(f"Situation: {situation}")
         print("=" * 50)
         
-        # Get relevant categories and laws
-        categories = assistant._identify_relevant_categories(situation)
-        expanded_categories = assistant._expand_categories(categories)
-        
-        # Analyze the situation and get results
+        # Analyze the situation and get results; analyze_situation already
+        # identifies and expands the relevant categories internally
         result = assistant.analyze_situation(situation)
         
         # Print results
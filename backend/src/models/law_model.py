@@ -4,7 +4,7 @@ Data models for Dutch Law MCP system.
 from dataclasses import dataclass, field
 from datetime import date
 from enum import Enum
-from typing import List, Dict, Optional, Any
+from typing import List, Dict, Optional, Any, Tuple
 
 
 class LawStatus(str, Enum):
@@ -13,7 +13,7 @@ class LawStatus(str, Enum):
     FUTURE = "Future"
 
 
-@dataclass
+@dataclass(slots=True)
 class Metadata:
     name_of_law: str
     citation_title: str
@@ -25,7 +25,7 @@ class Metadata:
     status: LawStatus
     
     
-@dataclass
+@dataclass(slots=True)
 class HierarchicalPosition:
     relationship_to_constitution: Optional[str] = None
     relationship_to_eu_law: Optional[str] = None
@@ -33,27 +33,27 @@ class HierarchicalPosition:
     position_within_national_legislation: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class IdentificationAndBasicData:
     metadata: Metadata
     hierarchical_position: HierarchicalPosition
 
 
-@dataclass
+@dataclass(slots=True)
 class Amendment:
     date: date
     description: str
     reference: str
 
 
-@dataclass
+@dataclass(slots=True)
 class PlannedAmendment:
     date: date
     description: str
     status: str
 
 
-@dataclass
+@dataclass(slots=True)
 class LegislativeHistory:
     initiator: Optional[str] = None
     reason: Optional[str] = None
@@ -62,191 +62,186 @@ class LegislativeHistory:
     important_changes: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class AmendmentHistory:
     amendments: List[Amendment] = field(default_factory=list)
     planned_amendments: List[PlannedAmendment] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class HistoricalContext:
     legislative_history: LegislativeHistory = field(default_factory=LegislativeHistory)
     amendment_history: AmendmentHistory = field(default_factory=AmendmentHistory)
 
 
-@dataclass
+@dataclass(slots=True)
 class CoreProvision:
     article: str
     description: str
 
 
-@dataclass
+@dataclass(slots=True)
 class Definition:
     term: str
     definition: str
 
 
-@dataclass
+@dataclass(slots=True)
 class StructuralOverview:
     chapter_structure: Optional[str] = None
     core_provisions: List[CoreProvision] = field(default_factory=list)
     definitions: List[Definition] = field(default_factory=list)
-    delegation_provisions: List[str] = field(default_factory=list)
+    delegation_provisions: Tuple[str, ...] = ()
 
 
-@dataclass
+@dataclass(slots=True)
 class ConceptualCategory:
     category: str
-    concepts: List[str] = field(default_factory=list)
+    concepts: Tuple[str, ...] = ()
 
 
-@dataclass
+@dataclass(slots=True)
 class SemanticRelationships:
     conceptual_categories: List[ConceptualCategory] = field(default_factory=list)
     legal_relationships: Optional[str] = None
     procedural_flowcharts: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ContentMapping:
     structural_overview: StructuralOverview = field(default_factory=StructuralOverview)
     semantic_relationships: SemanticRelationships = field(default_factory=SemanticRelationships)
 
 
-@dataclass
+@dataclass(slots=True)
 class LandmarkCase:
     case: str
     reference: str
     significance: str
 
 
-@dataclass
+@dataclass(slots=True)
 class CaseLaw:
     landmark_cases: List[LandmarkCase] = field(default_factory=list)
-    supreme_court_opinions: List[str] = field(default_factory=list)
-    international_case_law: List[str] = field(default_factory=list)
+    supreme_court_opinions: Tuple[str, ...] = ()
+    international_case_law: Tuple[str, ...] = ()
 
 
-@dataclass
+@dataclass(slots=True)
 class Doctrine:
-    key_literature: List[str] = field(default_factory=list)
+    key_literature: Tuple[str, ...] = ()
     academic_views: Optional[str] = None
-    relevant_annotations: List[str] = field(default_factory=list)
+    relevant_annotations: Tuple[str, ...] = ()
 
 
-@dataclass
+@dataclass(slots=True)
 class InterpretativeContext:
     case_law: CaseLaw = field(default_factory=CaseLaw)
     doctrine: Doctrine = field(default_factory=Doctrine)
 
 
-@dataclass
+@dataclass(slots=True)
 class ImplementationPractice:
-    responsible_authorities: List[str] = field(default_factory=list)
-    policy_rules: List[str] = field(default_factory=list)
-    supervision_and_enforcement: List[str] = field(default_factory=list)
+    responsible_authorities: Tuple[str, ...] = ()
+    policy_rules: Tuple[str, ...] = ()
+    supervision_and_enforcement: Tuple[str, ...] = ()
 
 
-@dataclass
+@dataclass(slots=True)
 class SocietalImpact:
-    target_groups: List[str] = field(default_factory=list)
-    practical_issues: List[str] = field(default_factory=list)
-    evaluations: List[str] = field(default_factory=list)
+    target_groups: Tuple[str, ...] = ()
+    practical_issues: Tuple[str, ...] = ()
+    evaluations: Tuple[str, ...] = ()
 
 
-@dataclass
+@dataclass(slots=True)
 class PracticalApplication:
     implementation_practice: ImplementationPractice = field(default_factory=ImplementationPractice)
     societal_impact: SocietalImpact = field(default_factory=SocietalImpact)
 
 
-@dataclass
+@dataclass(slots=True)
 class TechnicalSpecifications:
     api_access: Optional[str] = None
     linked_data: Optional[str] = None
     persistent_identifiers: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class UserInteraction:
-    visualization_tools: List[str] = field(default_factory=list)
-    search_methods: List[str] = field(default_factory=list)
-    notification_systems: List[str] = field(default_factory=list)
+    visualization_tools: Tuple[str, ...] = ()
+    search_methods: Tuple[str, ...] = ()
+    notification_systems: Tuple[str, ...] = ()
 
 
-@dataclass
+@dataclass(slots=True)
 class DigitalIntegration:
     technical_specifications: TechnicalSpecifications = field(default_factory=TechnicalSpecifications)
     user_interaction: UserInteraction = field(default_factory=UserInteraction)
 
 
-@dataclass
+@dataclass(slots=True)
 class PlannedDevelopments:
-    intended_changes: List[str] = field(default_factory=list)
-    current_policy_discussions: List[str] = field(default_factory=list)
-    innovative_applications: List[str] = field(default_factory=list)
+    intended_changes: Tuple[str, ...] = ()
+    current_policy_discussions: Tuple[str, ...] = ()
+    innovative_applications: Tuple[str, ...] = ()
 
 
-@dataclass
+@dataclass(slots=True)
 class RisksAndOpportunities:
-    identified_gaps: List[str] = field(default_factory=list)
-    technological_challenges: List[str] = field(default_factory=list)
-    harmonization_possibilities: List[str] = field(default_factory=list)
+    identified_gaps: Tuple[str, ...] = ()
+    technological_challenges: Tuple[str, ...] = ()
+    harmonization_possibilities: Tuple[str, ...] = ()
 
 
-@dataclass
+@dataclass(slots=True)
 class FuturePerspective:
     planned_developments: PlannedDevelopments = field(default_factory=PlannedDevelopments)
     risks_and_opportunities: RisksAndOpportunities = field(default_factory=RisksAndOpportunities)
 
 
-@dataclass
+@dataclass(slots=True)
 class LinguisticAspects:
     readability_index: Optional[str] = None
     alternatives_in_plain_language: Optional[str] = None
-    multilingual_versions: List[str] = field(default_factory=list)
+    multilingual_versions: Tuple[str, ...] = ()
 
 
-@dataclass
+@dataclass(slots=True)
 class Inclusivity:
     accessibility_for_people_with_disabilities: Optional[str] = None
     cultural_context: Optional[str] = None
-    educational_resources: List[str] = field(default_factory=list)
+    educational_resources: Tuple[str, ...] = ()
 
 
-@dataclass
+@dataclass(slots=True)
 class Accessibility:
     linguistic_aspects: LinguisticAspects = field(default_factory=LinguisticAspects)
     inclusivity: Inclusivity = field(default_factory=Inclusivity)
 
 
-@dataclass
+@dataclass(slots=True)
 class MCPLaw:
     """Model for representing a law in the MCP system."""
     metadata: Dict[str, Any]
     content: Dict[str, Any]
-    
+
+    _REQUIRED_META = (
+        "name_of_law",
+        "citation_title",
+        "date_of_entry_into_force",
+        "regulatory_authority",
+        "legal_domain",
+        "identification_number",
+    )
+    _REQUIRED_CONTENT = ("articles", "chapters", "sections")
+
     def __post_init__(self):
         """Validate the law data after initialization."""
-        required_metadata = [
-            "name_of_law",
-            "citation_title",
-            "date_of_entry_into_force",
-            "regulatory_authority",
-            "legal_domain",
-            "identification_number"
-        ]
-        
-        for field in required_metadata:
-            if field not in self.metadata:
-                self.metadata[field] = "Unknown"
-        
-        if "articles" not in self.content:
-            self.content["articles"] = []
-        if "chapters" not in self.content:
-            self.content["chapters"] = []
-        if "sections" not in self.content:
-            self.content["sections"] = []
+        for key in self._REQUIRED_META:
+            self.metadata.setdefault(key, "Unknown")
+        for key in self._REQUIRED_CONTENT:
+            self.content.setdefault(key, [])
 
     historical_context: HistoricalContext = field(default_factory=HistoricalContext)
     content_mapping: ContentMapping = field(default_factory=ContentMapping)
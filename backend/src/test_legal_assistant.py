@@ -1,8 +1,12 @@
 """
 Test script to verify MCP's ability to provide reliable legal assistance.
 """
+import functools
+import io
 import logging
-from typing import List, Dict, Any, Set
+import re
+from dataclasses import dataclass
+from typing import List, Dict, Any, Optional, Set, Tuple
 from src.models.wetten_parser import WettenParser
 from src.models.law_model import MCPLaw
 
@@ -10,6 +14,36 @@ from src.models.law_model import MCPLaw
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+
+@functools.lru_cache(maxsize=None)
+def _keywords_re(keywords: tuple):
+    """Compile one alternation for a branch's keyword set.
+
+    One search per article replaces a substring scan per keyword, and
+    the regex engine stops at the first hit. The handful of branch
+    keyword sets is fixed, so the cache stays tiny.
+    """
+    return re.compile(
+        "|".join(re.escape(keyword) for keyword in sorted(keywords, key=len, reverse=True))
+    )
+
+@dataclass(slots=True, frozen=True)
+class AdviceBranch:
+    """One advice branch of _generate_advice, expressed as data.
+
+    `category` gates the branch, `domain` and `keywords` select the law
+    and articles to cite, and `and_also` holds a follow-up branch that
+    fires when its own category is also present (the employment block
+    nested under discrimination).
+    """
+    category: str
+    domain: str
+    keywords: Tuple[str, ...]
+    law_header: str
+    advice_text: str
+    and_also: Optional["AdviceBranch"] = None
+
+
 class LegalAssistant:
     """Test class to verify MCP's legal assistance capabilities."""
     
@@ -66,29 +100,167 @@ class LegalAssistant:
             "employment": ["civil", "discrimination"],
             "administrative": ["constitutional"],
         }
-    
+
+        # Precompiled single-pass keyword scanner: every keyword carries a
+        # bitmask of the categories it indicates, and one alternation regex
+        # (longest keywords first) finds all hits in a linear scan instead
+        # of a substring search per keyword
+        self._category_order = tuple(self.category_keywords)
+        category_bits = {
+            category: 1 << index for index, category in enumerate(self._category_order)
+        }
+        self._keyword_bits: Dict[str, int] = {}
+        for category, keywords in self.category_keywords.items():
+            for keyword in keywords:
+                keyword = keyword.lower()
+                self._keyword_bits[keyword] = (
+                    self._keyword_bits.get(keyword, 0) | category_bits[category]
+                )
+        # A hit on a keyword also implies hits on every keyword contained
+        # in it (e.g. "ongelijke behandeling" contains "gelijke behandeling"),
+        # mirroring the old per-keyword substring semantics
+        for keyword, mask in list(self._keyword_bits.items()):
+            for other, other_mask in self._keyword_bits.items():
+                if other != keyword and other in keyword:
+                    mask |= other_mask
+            self._keyword_bits[keyword] = mask
+        self._keyword_re = re.compile(
+            "|".join(
+                re.escape(keyword)
+                for keyword in sorted(self._keyword_bits, key=len, reverse=True)
+            )
+        )
+
+        # Transitive closure of related_categories, computed once with a
+        # fixed-point loop; expansion then reduces to a union of
+        # precomputed frozensets. The closure also picks up indirect
+        # relations (discrimination -> employment -> civil) that a
+        # single-step expansion misses.
+        closure = {category: {category} for category in self.category_keywords}
+        changed = True
+        while changed:
+            changed = False
+            for category, related in self.related_categories.items():
+                expanded = closure[category].union(*(closure[r] for r in related))
+                if expanded != closure[category]:
+                    closure[category] = expanded
+                    changed = True
+        self._category_closure = {
+            category: frozenset(members) for category, members in closure.items()
+        }
+
+        # Memoized article selections keyed by (law, keyword set); the
+        # laws behind the category table change rarely, so repeat queries
+        # reuse the scan result instead of rescanning every article
+        self._article_hits: Dict[Any, List[Dict[str, Any]]] = {}
+
+        # The advice branches as data, in priority order; _generate_advice
+        # fires the first branch whose category matched, so adding a
+        # branch is one table entry instead of another elif block
+        self._advice_branches: Tuple[AdviceBranch, ...] = (
+            AdviceBranch(
+                category="discrimination",
+                domain="Equal Treatment Law",
+                keywords=("discriminatie", "gelijke behandeling"),
+                law_header="\nRelevante artikelen uit de Algemene wet gelijke behandeling:",
+                advice_text=(
+                    "\nBij discriminatie heeft u verschillende rechtsmiddelen tot uw beschikking:\n"
+                    "1. U kunt een klacht indienen bij het College voor de Rechten van de Mens\n"
+                    "2. U kunt contact opnemen met een antidiscriminatiebureau in uw regio\n"
+                    "3. U kunt juridische bijstand zoeken via het Juridisch Loket of een advocaat\n"
+                    "4. In geval van strafbare discriminatie kunt u aangifte doen bij de politie"
+                ),
+                and_also=AdviceBranch(
+                    category="employment",
+                    domain="Employment Law",
+                    keywords=("discriminatie", "gelijke behandeling", "arbeidsvoorwaarden"),
+                    law_header="\nRelevante artikelen uit de Wet op de arbeidsovereenkomst:",
+                    advice_text=(
+                        "\nSpecifiek voor discriminatie op het werk:\n"
+                        "1. Meld de situatie eerst bij uw leidinggevende of HR-afdeling\n"
+                        "2. Neem contact op met de vertrouwenspersoon binnen uw organisatie\n"
+                        "3. Schakel uw ondernemingsraad in als die er is\n"
+                        "4. Overweeg contact met een vakbond voor juridische ondersteuning"
+                    ),
+                ),
+            ),
+            AdviceBranch(
+                category="employment",
+                domain="Employment Law",
+                keywords=("arbeidsovereenkomst", "ontslag", "salaris"),
+                law_header="\nRelevante artikelen uit de Wet op de arbeidsovereenkomst:",
+                advice_text=(
+                    "\nBij arbeidsrechtelijke kwesties:\n"
+                    "1. Controleer uw arbeidsovereenkomst en de CAO\n"
+                    "2. Neem contact op met uw vakbond of een arbeidsrechtadvocaat\n"
+                    "3. Het Juridisch Loket kan u informeren over uw rechten\n"
+                    "4. Bewaar alle relevante documenten en correspondentie"
+                ),
+            ),
+            AdviceBranch(
+                category="administrative",
+                domain="Administrative Law",
+                keywords=("bezwaar", "beroep", "besluit"),
+                law_header="\nRelevante artikelen uit de Algemene wet bestuursrecht:",
+                advice_text=(
+                    "\nVoor procedures met de overheid:\n"
+                    "1. Let op de bezwaartermijn (meestal 6 weken)\n"
+                    "2. Verzamel alle relevante documenten\n"
+                    "3. Overweeg juridische bijstand via het Juridisch Loket\n"
+                    "4. U kunt vaak gratis advies krijgen bij uw gemeente"
+                ),
+            ),
+            AdviceBranch(
+                category="civil",
+                domain="Civil Law",
+                keywords=("contract", "huur", "koop"),
+                law_header="\nRelevante artikelen uit het Burgerlijk Wetboek:",
+                advice_text=(
+                    "\nBij civielrechtelijke geschillen:\n"
+                    "1. Verzamel alle relevante documenten en correspondentie\n"
+                    "2. Probeer eerst in overleg tot een oplossing te komen\n"
+                    "3. Overweeg mediation als alternatief voor een rechtszaak\n"
+                    "4. Zoek tijdig juridische bijstand als een oplossing uitblijft"
+                ),
+            ),
+        )
+
     def analyze_situation(self, situation: str) -> Dict[str, Any]:
         """Analyze a legal situation and find relevant laws."""
         logger.info(f"\nAnalyzing situation: {situation}")
         
+        # Lowered once here; every downstream text scan reuses it
+        situation_lower = situation.lower()
+
         # First, try to identify relevant law categories
-        relevant_categories = self._identify_relevant_categories(situation)
+        relevant_categories = self._identify_relevant_categories(situation_lower)
         logger.info(f"Identified relevant categories: {relevant_categories}")
         
         # Add related categories
         expanded_categories = self._expand_categories(relevant_categories)
         logger.info(f"Expanded categories: {expanded_categories}")
         
-        # Fetch and analyze relevant laws
+        # Fetch and analyze relevant laws; the fetches are I/O bound, so
+        # they go through the parser's thread pool instead of a serial loop
+        fetch_categories = [
+            category for category in expanded_categories if category in self.law_categories
+        ]
         relevant_laws = []
-        for category in expanded_categories:
-            if category in self.law_categories:
-                try:
-                    law = self.parser.parse_law_to_mcp(self.law_categories[category])
-                    relevant_laws.append(law)
-                    logger.info(f"Successfully parsed {category} law")
-                except Exception as e:
-                    logger.error(f"Failed to parse {category} law: {e}")
+        if fetch_categories:
+            try:
+                relevant_laws = self.parser.parse_many(
+                    [self.law_categories[category] for category in fetch_categories]
+                )
+                logger.info(f"Successfully parsed laws for: {', '.join(fetch_categories)}")
+            except Exception as e:
+                logger.error(f"Bulk law fetch failed, falling back to serial: {e}")
+                for category in fetch_categories:
+                    try:
+                        relevant_laws.append(
+                            self.parser.parse_law_to_mcp(self.law_categories[category])
+                        )
+                    except Exception as e:
+                        logger.error(f"Failed to parse {category} law: {e}")
         
         # Analyze the laws and provide structured advice
         advice = self._generate_advice(situation, relevant_laws, expanded_categories)
@@ -101,149 +273,115 @@ class LegalAssistant:
             "references": self._extract_references(relevant_laws)
         }
     
-    def _identify_relevant_categories(self, situation: str) -> Set[str]:
-        """Identify which law categories are relevant to the situation."""
-        categories = set()
-        situation_lower = situation.lower()
-        
-        # Check each category's keywords
-        for category, keywords in self.category_keywords.items():
-            if any(keyword in situation_lower for keyword in keywords):
-                categories.add(category)
-        
-        return categories
+    def _identify_relevant_categories(self, situation_lower: str) -> Set[str]:
+        """Identify which law categories are relevant to the situation.
+
+        Takes the pre-lowered situation so callers making several scan
+        passes pay for the lowering only once.
+        """
+        mask = 0
+        for match in self._keyword_re.finditer(situation_lower):
+            mask |= self._keyword_bits[match.group(0)]
+
+        return {
+            category
+            for index, category in enumerate(self._category_order)
+            if mask & (1 << index)
+        }
     
     def _expand_categories(self, categories: Set[str]) -> Set[str]:
-        """Expand categories with related categories."""
-        expanded = categories.copy()
-        for category in categories:
-            if category in self.related_categories:
-                expanded.update(self.related_categories[category])
-        return expanded
+        """Expand categories with their transitively related categories."""
+        return set().union(
+            *(self._category_closure.get(category, {category}) for category in categories)
+        )
     
+    def _relevant_articles(self, law: MCPLaw, keywords: tuple) -> List[Dict[str, Any]]:
+        """Return the articles of `law` mentioning any of `keywords`.
+
+        A tokenized inverted index would lose the substring semantics the
+        advice branches rely on (e.g. "koop" matching "verkoop"), so the
+        selection stays a substring scan but is memoized per law and
+        keyword set.
+        """
+        cache_key = (
+            law.metadata["identification_number"],
+            law.metadata.get("version", ""),
+            keywords,
+        )
+        hits = self._article_hits.get(cache_key)
+        if hits is None:
+            pattern = _keywords_re(keywords)
+            hits = []
+            for article in law.content["articles"]:
+                # Lower the text once per article; laws are cached and
+                # rescanned across queries, so the per-query .lower()
+                # allocations add up on large laws
+                text_lc = article.get("_text_lc")
+                if text_lc is None:
+                    text_lc = article["text"].lower()
+                    article["_text_lc"] = text_lc
+                if pattern.search(text_lc):
+                    hits.append(article)
+            if len(self._article_hits) >= 256:
+                self._article_hits.pop(next(iter(self._article_hits)))
+            self._article_hits[cache_key] = hits
+        return hits
+
     def _generate_advice(self, situation: str, laws: List[MCPLaw], categories: Set[str]) -> str:
         """Generate advice based on relevant laws."""
         if not laws:
             return "Geen relevante wetgeving gevonden voor deze situatie."
         
-        advice_parts = []
-        
+        # Advice accumulates in a write buffer instead of a list that
+        # join() copies wholesale at the end
+        buf = io.StringIO()
+
+        def emit(part: str) -> None:
+            if buf.tell():
+                buf.write("\n\n")
+            buf.write(part)
+
+        # One pass instead of a linear scan per advice branch
+        by_domain = {law.metadata["legal_domain"]: law for law in laws}
+
         # First, add general information about each law
         for law in laws:
             metadata = law.metadata
-            advice_parts.append(
+            emit(
                 f"De {metadata['name_of_law']} ({metadata['citation_title']}) is relevant voor uw situatie. "
                 f"Deze wet is van kracht sinds {metadata['date_of_entry_into_force']} en wordt beheerd door "
                 f"{metadata['regulatory_authority']}."
             )
         
-        # Then, add specific advice based on the categories
-        if "discrimination" in categories:
-            # Find relevant articles from the discrimination law
-            discrimination_law = next((law for law in laws if law.metadata["legal_domain"] == "Equal Treatment Law"), None)
-            if discrimination_law and discrimination_law.content["articles"]:
-                relevant_articles = [
-                    article for article in discrimination_law.content["articles"]
-                    if any(keyword in article["text"].lower() for keyword in ["discriminatie", "gelijke behandeling"])
-                ]
-                if relevant_articles:
-                    advice_parts.append("\nRelevante artikelen uit de Algemene wet gelijke behandeling:")
-                    for article in relevant_articles[:3]:  # Show up to 3 relevant articles
-                        advice_parts.append(f"- Artikel {article['number']}: {article['title']}")
-            
-            advice_parts.append(
-                "\nBij discriminatie heeft u verschillende rechtsmiddelen tot uw beschikking:\n"
-                "1. U kunt een klacht indienen bij het College voor de Rechten van de Mens\n"
-                "2. U kunt contact opnemen met een antidiscriminatiebureau in uw regio\n"
-                "3. U kunt juridische bijstand zoeken via het Juridisch Loket of een advocaat\n"
-                "4. In geval van strafbare discriminatie kunt u aangifte doen bij de politie"
-            )
-            
-            if "employment" in categories:
-                # Find relevant articles from the employment law
-                employment_law = next((law for law in laws if law.metadata["legal_domain"] == "Employment Law"), None)
-                if employment_law and employment_law.content["articles"]:
-                    relevant_articles = [
-                        article for article in employment_law.content["articles"]
-                        if any(keyword in article["text"].lower() for keyword in ["discriminatie", "gelijke behandeling", "arbeidsvoorwaarden"])
-                    ]
-                    if relevant_articles:
-                        advice_parts.append("\nRelevante artikelen uit de Wet op de arbeidsovereenkomst:")
-                        for article in relevant_articles[:3]:  # Show up to 3 relevant articles
-                            advice_parts.append(f"- Artikel {article['number']}: {article['title']}")
-                
-                advice_parts.append(
-                    "\nSpecifiek voor discriminatie op het werk:\n"
-                    "1. Meld de situatie eerst bij uw leidinggevende of HR-afdeling\n"
-                    "2. Neem contact op met de vertrouwenspersoon binnen uw organisatie\n"
-                    "3. Schakel uw ondernemingsraad in als die er is\n"
-                    "4. Overweeg contact met een vakbond voor juridische ondersteuning"
-                )
-        
-        elif "employment" in categories:
-            # Find relevant articles from the employment law
-            employment_law = next((law for law in laws if law.metadata["legal_domain"] == "Employment Law"), None)
-            if employment_law and employment_law.content["articles"]:
-                relevant_articles = [
-                    article for article in employment_law.content["articles"]
-                    if any(keyword in article["text"].lower() for keyword in ["arbeidsovereenkomst", "ontslag", "salaris"])
-                ]
-                if relevant_articles:
-                    advice_parts.append("\nRelevante artikelen uit de Wet op de arbeidsovereenkomst:")
-                    for article in relevant_articles[:3]:  # Show up to 3 relevant articles
-                        advice_parts.append(f"- Artikel {article['number']}: {article['title']}")
-            
-            advice_parts.append(
-                "\nBij arbeidsrechtelijke kwesties:\n"
-                "1. Controleer uw arbeidsovereenkomst en de CAO\n"
-                "2. Neem contact op met uw vakbond of een arbeidsrechtadvocaat\n"
-                "3. Het Juridisch Loket kan u informeren over uw rechten\n"
-                "4. Bewaar alle relevante documenten en correspondentie"
-            )
-        
-        elif "administrative" in categories:
-            # Find relevant articles from the administrative law
-            administrative_law = next((law for law in laws if law.metadata["legal_domain"] == "Administrative Law"), None)
-            if administrative_law and administrative_law.content["articles"]:
-                relevant_articles = [
-                    article for article in administrative_law.content["articles"]
-                    if any(keyword in article["text"].lower() for keyword in ["bezwaar", "beroep", "besluit"])
-                ]
-                if relevant_articles:
-                    advice_parts.append("\nRelevante artikelen uit de Algemene wet bestuursrecht:")
-                    for article in relevant_articles[:3]:  # Show up to 3 relevant articles
-                        advice_parts.append(f"- Artikel {article['number']}: {article['title']}")
-            
-            advice_parts.append(
-                "\nVoor procedures met de overheid:\n"
-                "1. Let op de bezwaartermijn (meestal 6 weken)\n"
-                "2. Verzamel alle relevante documenten\n"
-                "3. Overweeg juridische bijstand via het Juridisch Loket\n"
-                "4. U kunt vaak gratis advies krijgen bij uw gemeente"
-            )
-        
-        elif "civil" in categories:
-            # Find relevant articles from the civil law
-            civil_law = next((law for law in laws if law.metadata["legal_domain"] == "Civil Law"), None)
-            if civil_law and civil_law.content["articles"]:
-                relevant_articles = [
-                    article for article in civil_law.content["articles"]
-                    if any(keyword in article["text"].lower() for keyword in ["contract", "huur", "koop"])
-                ]
-                if relevant_articles:
-                    advice_parts.append("\nRelevante artikelen uit het Burgerlijk Wetboek:")
-                    for article in relevant_articles[:3]:  # Show up to 3 relevant articles
-                        advice_parts.append(f"- Artikel {article['number']}: {article['title']}")
-            
-            advice_parts.append(
-                "\nBij civielrechtelijke geschillen:\n"
-                "1. Verzamel alle relevante documenten en correspondentie\n"
-                "2. Probeer eerst in overleg tot een oplossing te komen\n"
-                "3. Overweeg mediation als alternatief voor een rechtszaak\n"
-                "4. Zoek tijdig juridische bijstand als een oplossing uitblijft"
-            )
-        
-        return "\n\n".join(advice_parts)
+        # Then, add specific advice based on the categories; the first
+        # branch whose category is present fires, like the old elif chain
+        for branch in self._advice_branches:
+            if branch.category in categories:
+                self._emit_branch(branch, by_domain, categories, emit)
+                break
+
+        return buf.getvalue()
+
+    def _emit_branch(
+        self,
+        branch: "AdviceBranch",
+        by_domain: Dict[str, MCPLaw],
+        categories: Set[str],
+        emit,
+    ) -> None:
+        """Write one advice branch, plus its follow-up when applicable."""
+        law = by_domain.get(branch.domain)
+        if law and law.content["articles"]:
+            relevant_articles = self._relevant_articles(law, branch.keywords)
+            if relevant_articles:
+                emit(branch.law_header)
+                for article in relevant_articles[:3]:  # Show up to 3 relevant articles
+                    emit(f"- Artikel {article['number']}: {article['title']}")
+
+        emit(branch.advice_text)
+
+        if branch.and_also is not None and branch.and_also.category in categories:
+            self._emit_branch(branch.and_also, by_domain, categories, emit)
     
     def _extract_references(self, laws: List[MCPLaw]) -> List[Dict[str, str]]:
         """Extract references from laws in a consistent format."""
@@ -1,36 +1,104 @@
 """
 Web interface for the Dutch Legal Assistant.
 """
-from flask import Flask, render_template, request, jsonify, session
+import asyncio
+import hashlib
+import threading
+import uuid
+
+from flask import Flask, render_template, request, jsonify, session, Response
 from flask_cors import CORS
 from src.test_legal_assistant import LegalAssistant
-import uuid
 
 app = Flask(__name__)
 CORS(app, supports_credentials=True)  # Allow all origins during development
 app.secret_key = 'your-secret-key-here'  # Change this to a secure secret key in production
 
-# Initialize the legal assistant
-legal_assistant = LegalAssistant()
+# How many analysis results to remember per session for reuse by
+# /api/download-advice
+RESULT_CACHE_SIZE = 16
+
+# Server-side per-conversation state. The default Flask session backend
+# serializes everything into a signed cookie on every response, so
+# keeping the full history there would pay serialization per request and
+# overflow the ~4KB cookie limit; only the conversation ID travels in
+# the cookie. Oldest conversations are evicted once the cap is reached.
+MAX_CONVERSATIONS = 256
+_conversations = {}
+_conversations_lock = threading.Lock()
+
+# Per-reference block of the advice document served by /api/download-advice
+REFERENCE_TEMPLATE = """
+{name_of_law} ({citation_title})
+BWB ID: {identification_number}
+Domain: {legal_domain}
+Entry into force: {date_of_entry_into_force}
+Regulatory authority: {regulatory_authority}
+"""
+
+# The legal assistant is constructed lazily on first use so importing the
+# app (e.g. for gunicorn --preload or tooling) stays cheap; the lock keeps
+# concurrent first requests from building it twice
+_assistant = None
+_assistant_lock = threading.Lock()
+
+
+def get_assistant():
+    """Return the shared LegalAssistant, constructing it on first call."""
+    global _assistant
+    if _assistant is None:
+        with _assistant_lock:
+            if _assistant is None:
+                _assistant = LegalAssistant()
+    return _assistant
+
+
+def _situation_key(situation):
+    """Stable cache key for a situation string."""
+    return hashlib.sha1(situation.encode('utf-8')).hexdigest()
+
+
+def _conversation_state():
+    """Return this session's server-side state, creating it on first use."""
+    conversation_id = session.get('conversation_id')
+    if conversation_id is None:
+        conversation_id = str(uuid.uuid4())
+        session['conversation_id'] = conversation_id
+    with _conversations_lock:
+        state = _conversations.get(conversation_id)
+        if state is None:
+            while len(_conversations) >= MAX_CONVERSATIONS:
+                _conversations.pop(next(iter(_conversations)))
+            state = {'history': [], 'results': {}}
+            _conversations[conversation_id] = state
+    return state
+
+
+def _remember_result(state, situation, result):
+    """Store an analysis result server-side, oldest evicted first."""
+    cache = state['results']
+    cache[_situation_key(situation)] = result
+    while len(cache) > RESULT_CACHE_SIZE:
+        cache.pop(next(iter(cache)))
 
 @app.route('/')
 def home():
     """Render the home page."""
-    if 'conversation_id' not in session:
-        session['conversation_id'] = str(uuid.uuid4())
-        session['conversation_history'] = []
-    return render_template('index.html', history=session['conversation_history'])
+    return render_template('index.html', history=_conversation_state()['history'])
 
 @app.route('/api/analyze', methods=['POST'])
-def analyze():
+async def analyze():
     """Analyze a legal situation and return advice."""
     data = request.get_json()
     situation = data.get('situation', '')
-    
+    state = _conversation_state()
+
     try:
-        # Analyze the situation
-        result = legal_assistant.analyze_situation(situation)
-        
+        # Analysis does network I/O; run it off the event loop so other
+        # requests keep being served while we wait
+        result = await asyncio.to_thread(get_assistant().analyze_situation, situation)
+        _remember_result(state, situation, result)
+
         # Format the response
         response = {
             'categories': result['relevant_categories'],
@@ -38,15 +106,14 @@ def analyze():
             'advice': result['advice'],
             'references': result['references']
         }
-        
+
         # Add to conversation history
         history_entry = {
             'situation': situation,
             'response': response
         }
-        session['conversation_history'].append(history_entry)
-        session.modified = True
-        
+        state['history'].append(history_entry)
+
         return jsonify({'success': True, 'data': response})
     
     except Exception as e:
@@ -55,19 +122,29 @@ def analyze():
 @app.route('/api/clear-history', methods=['POST'])
 def clear_history():
     """Clear the conversation history."""
-    session['conversation_history'] = []
-    session.modified = True
+    _conversation_state()['history'].clear()
     return jsonify({'success': True})
 
 @app.route('/api/download-advice', methods=['POST'])
-def download_advice():
+async def download_advice():
     """Generate and download advice document."""
     data = request.get_json()
     situation = data.get('situation', '')
-    result = legal_assistant.analyze_situation(situation)
+    state = _conversation_state()
+
+    # Reuse the result from /api/analyze when the same situation was just
+    # analyzed; only recompute on a cache miss
+    result = state['results'].get(_situation_key(situation))
+    if result is None:
+        result = await asyncio.to_thread(get_assistant().analyze_situation, situation)
+        _remember_result(state, situation, result)
     
-    # Format the document content
-    content = f"""
+    filename = f"legal_advice_{session['conversation_id'][:8]}.txt"
+
+    # Stream the document as plain text instead of buffering it inside a
+    # JSON payload; the browser saves it straight from the response body
+    def generate():
+        yield f"""
 Legal Advice Report
 ==================
 
@@ -90,20 +167,14 @@ Advice
 References
 ----------
 """
-    for ref in result['references']:
-        content += f"""
-{ref['name_of_law']} ({ref['citation_title']})
-BWB ID: {ref['identification_number']}
-Domain: {ref['legal_domain']}
-Entry into force: {ref['date_of_entry_into_force']}
-Regulatory authority: {ref['regulatory_authority']}
-"""
-    
-    return jsonify({
-        'success': True,
-        'content': content,
-        'filename': f"legal_advice_{session['conversation_id'][:8]}.txt"
-    })
+        for ref in result['references']:
+            yield REFERENCE_TEMPLATE.format(**ref)
+
+    return Response(
+        generate(),
+        mimetype='text/plain',
+        headers={'Content-Disposition': f'attachment; filename="{filename}"'}
+    )
 
 if __name__ == '__main__':
     app.run(debug=True, host='0.0.0.0', port=8080) 
\ No newline at end of file
@@ -146,15 +146,18 @@ document.addEventListener('DOMContentLoaded', () => {
                 body: JSON.stringify({ situation }),
             });
             
-            const result = await response.json();
-            
-            if (result.success) {
-                // Create and download the file
-                const blob = new Blob([result.content], { type: 'text/plain' });
+            if (response.ok) {
+                // The server streams the document directly; take the
+                // filename from the Content-Disposition header
+                const disposition = response.headers.get('Content-Disposition') || '';
+                const match = disposition.match(/filename="([^"]+)"/);
+                const filename = match ? match[1] : 'legal_advice.txt';
+
+                const blob = await response.blob();
                 const url = window.URL.createObjectURL(blob);
                 const a = document.createElement('a');
                 a.href = url;
-                a.download = result.filename;
+                a.download = filename;
                 document.body.appendChild(a);
                 a.click();
                 window.URL.revokeObjectURL(url);